@@ -34,6 +34,7 @@ from .lib import (
     get_current_sequence,
     get_timeline_selection,
     get_current_track,
+    iter_track_item_tags,
     get_track_item_tags,
     get_track_openpype_tag,
     set_track_openpype_tag,
@@ -99,6 +100,7 @@ __all__ = [
     "get_current_sequence",
     "get_timeline_selection",
     "get_current_track",
+    "iter_track_item_tags",
     "get_track_item_tags",
     "get_track_openpype_tag",
     "set_track_openpype_tag",
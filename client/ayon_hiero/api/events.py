@@ -1,8 +1,10 @@
 import os
 
 import hiero.core.events
+import ayon_api
 
 from ayon_core.lib import Logger, register_event_callback
+from ayon_core.pipeline import get_current_project_name
 
 from .lib import (
     sync_avalon_data_to_workfile,
@@ -33,11 +35,14 @@ def beforeNewProjectCreated(event):
 
 def afterNewProjectCreated(event):
     log.info("after new project created event...")
+    # one project query shared by workfile sync and tags
+    project_entity = ayon_api.get_project(get_current_project_name())
+
     # sync avalon data to project properties
-    sync_avalon_data_to_workfile()
+    sync_avalon_data_to_workfile(project_entity)
 
     # add tags from preset
-    add_tags_to_workfile()
+    add_tags_to_workfile(project_entity)
 
     # Workfiles.
     if int(os.environ.get("WORKFILES_STARTUP", "0")):
@@ -55,11 +60,14 @@ def beforeProjectLoad(event):
 
 def afterProjectLoad(event):
     log.info("after project load event...")
+    # one project query shared by workfile sync and tags
+    project_entity = ayon_api.get_project(get_current_project_name())
+
     # sync avalon data to project properties
-    sync_avalon_data_to_workfile()
+    sync_avalon_data_to_workfile(project_entity)
 
     # add tags from preset
-    add_tags_to_workfile()
+    add_tags_to_workfile(project_entity)
 
 
 def beforeProjectClosed(event):
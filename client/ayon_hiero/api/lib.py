@@ -2,7 +2,6 @@
 Host specific functions where host api is connected
 """
 
-from copy import deepcopy
 import os
 import re
 import platform
@@ -41,6 +40,7 @@ class _CTX:
     has_been_setup = False
     has_menu = False
     parent_gui = None
+    syncing_clip_names = False
 
 
 class DeprecatedWarning(DeprecationWarning):
@@ -90,14 +90,53 @@ def deprecated(new_destination):
 
 log = Logger.get_logger(__name__)
 
+_PLATFORM_NAME = platform.system().lower()
+
+# hiero classes used in loops, resolved once
+_TrackItem = hiero.core.TrackItem
+_VideoTrack = hiero.core.VideoTrack
+_AudioTrack = hiero.core.AudioTrack
+_Bin = hiero.core.Bin
+_BinItem = hiero.core.BinItem
+
+# groups: integer, True, False, None, plain identifier string
+_TAG_VALUE_REGEX = re.compile(r"^(?:(\d+)|(True)|(False)|(None)|(\w+))\Z")
+_TAG_VALUE_LITERALS = {"True": True, "False": False, "None": None}
+
+# publish attribute is stored in tag as string
+_BOOL_TO_STR = {True: "True", False: "False"}
+_STR_TO_BOOL = {"True": True, "False": False}
+
+_SEQUENCE_TYPES = (list, tuple)
+
+_CLIENT_VERSION_REGEX = re.compile(r"[/_.]v\d+", re.IGNORECASE)
+
+# hashes, printf padding or frame number in front of extension
+_SEQUENCE_PATTERN_REGEX = re.compile(
+    r"(#+)|(%\d+d)|(?<=[^a-zA-Z0-9])(\d+)(?=\.\w+$)")
+_DIGITS_REGEX = re.compile(r"\d+")
+
+
+def _get_openpype_tag(obj):
+    # shared by track and track item getters
+    for tag in obj.tags() or ():
+        # return only correct tag defined by global name
+        if OPENPYPE_TAG_NAME in tag.name():
+            return tag
+    return None
+
 
 def flatten(list_):
-    for item_ in list_:
-        if isinstance(item_, (list, tuple)):
-            for sub_item in flatten(item_):
-                yield sub_item
-        else:
+    # iterate with explicit stack so deep nesting does not recurse
+    stack = [iter(list_)]
+    while stack:
+        for item_ in stack[-1]:
+            if isinstance(item_, _SEQUENCE_TYPES):
+                stack.append(iter(item_))
+                break
             yield item_
+        else:
+            stack.pop()
 
 
 def get_current_project(remove_untitled=False):
@@ -132,7 +171,7 @@ def get_current_sequence(name=None, new=False):
         # create new
         name = name or DEFAULT_SEQUENCE_NAME
         sequence = hiero.core.Sequence(name)
-        root_bin.addItem(hiero.core.BinItem(sequence))
+        root_bin.addItem(_BinItem(sequence))
     elif name:
         # look for sequence by name
         sequences = project.sequences()
@@ -169,22 +208,16 @@ def get_current_track(sequence, name, audio=False):
     Returns:
         hiero.core.Track: the track object
     """
-    tracks = sequence.videoTracks()
-
-    if audio:
-        tracks = sequence.audioTracks()
+    tracks = sequence.audioTracks() if audio else sequence.videoTracks()
 
     # get track by name
-    track = None
-    for _track in tracks:
-        if _track.name() == name:
-            track = _track
+    track = {_track.name(): _track for _track in tracks}.get(name)
 
     if not track:
         if not audio:
-            track = hiero.core.VideoTrack(name)
+            track = _VideoTrack(name)
         else:
-            track = hiero.core.AudioTrack(name)
+            track = _AudioTrack(name)
 
         sequence.addTrack(track)
 
@@ -219,24 +252,40 @@ def get_track_items(
     selection = selection or []
     return_list = []
 
+    # resolve filters once so the per item check stays flat
+    track_class = {
+        "video": _VideoTrack,
+        "audio": _AudioTrack
+    }.get(track_type)
+    if track_class is None:
+        return return_list
+
+    def _is_valid(track_item):
+        if check_enabled and not track_item.isEnabled():
+            return False
+        parent = track_item.parent()
+        if not isinstance(parent, track_class):
+            return False
+        if check_tagged and not track_item.tags():
+            return False
+        # filter only items fitting input track name
+        if track_name and track_name not in parent.name():
+            return False
+        if track_item_name and track_item_name not in track_item.name():
+            return False
+        return True
+
     # get selected track items or all in active sequence
     if selection:
         try:
             for track_item in selection:
-                log.info("___ track_item: {}".format(track_item))
+                log.debug("___ track_item: %s", track_item)
                 # make sure only trackitems are selected
-                if not isinstance(track_item, hiero.core.TrackItem):
+                if not isinstance(track_item, _TrackItem):
                     continue
 
-                if _validate_all_atrributes(
-                    track_item,
-                    track_item_name,
-                    track_name,
-                    track_type,
-                    check_enabled,
-                    check_tagged
-                ):
-                    log.info("___ valid trackitem: {}".format(track_item))
+                if _is_valid(track_item):
+                    log.debug("___ valid trackitem: %s", track_item)
                     return_list.append(track_item)
         except AttributeError:
             pass
@@ -259,74 +308,29 @@ def get_track_items(
             # and all items in track
             for track_item in track.items():
                 # make sure no subtrackitem is also track items
-                if not isinstance(track_item, hiero.core.TrackItem):
+                if not isinstance(track_item, _TrackItem):
                     continue
 
-                if _validate_all_atrributes(
-                    track_item,
-                    track_item_name,
-                    track_name,
-                    track_type,
-                    check_enabled,
-                    check_tagged
-                ):
+                if _is_valid(track_item):
                     return_list.append(track_item)
 
     return return_list
 
 
-def _validate_all_atrributes(
-    track_item,
-    track_item_name,
-    track_name,
-    track_type,
-    check_enabled,
-    check_tagged
-):
-    def _validate_correct_name_track_item():
-        if track_item_name and track_item_name in track_item.name():
-            return True
-        elif not track_item_name:
-            return True
-
-    def _validate_tagged_track_item():
-        if check_tagged and track_item.tags():
-            return True
-        elif not check_tagged:
-            return True
-
-    def _validate_enabled_track_item():
-        if check_enabled and track_item.isEnabled():
-            return True
-        elif not check_enabled:
-            return True
-
-    def _validate_parent_track_item():
-        if track_name and track_name in track_item.parent().name():
-            # filter only items fitting input track name
-            return True
-        elif not track_name:
-            # or add all if no track_name was defined
-            return True
-
-    def _validate_type_track_item():
-        if track_type == "video" and isinstance(
-                track_item.parent(), hiero.core.VideoTrack):
-            # only video track items are allowed
-            return True
-        elif track_type == "audio" and isinstance(
-                track_item.parent(), hiero.core.AudioTrack):
-            # only audio track items are allowed
-            return True
-
-    # check if track item is enabled
-    return all([
-        _validate_enabled_track_item(),
-        _validate_type_track_item(),
-        _validate_tagged_track_item(),
-        _validate_parent_track_item(),
-        _validate_correct_name_track_item()
-    ])
+def iter_track_item_tags(track_item):
+    """
+    Iterate track item tags excluded openpype tag
+
+    Attributes:
+        trackItem (hiero.core.TrackItem): hiero object
+
+    Yields:
+        hiero.core.Tag: hierarchy, orig clip attributes
+    """
+    for tag in track_item.tags() or ():
+        # skip openpype tag
+        if tag.name() != OPENPYPE_TAG_NAME:
+            yield tag
 
 
 def get_track_item_tags(track_item):
@@ -337,21 +341,9 @@ def get_track_item_tags(track_item):
         trackItem (hiero.core.TrackItem): hiero object
 
     Returns:
-        hiero.core.Tag: hierarchy, orig clip attributes
+        list: hiero.core.Tag objects
     """
-    returning_tag_data = []
-    # get all tags from track item
-    _tags = track_item.tags()
-    if not _tags:
-        return []
-
-    # collect all tags which are not openpype tag
-    returning_tag_data.extend(
-        tag for tag in _tags
-        if tag.name() != OPENPYPE_TAG_NAME
-    )
-
-    return returning_tag_data
+    return list(iter_track_item_tags(track_item))
 
 
 def _get_tag_unique_hash():
@@ -409,14 +401,7 @@ def get_track_openpype_tag(track):
     Returns:
         hiero.core.Tag: hierarchy, orig clip attributes
     """
-    # get all tags from track item
-    _tags = track.tags()
-    if not _tags:
-        return None
-    for tag in _tags:
-        # return only correct tag defined by global name
-        if OPENPYPE_TAG_NAME in tag.name():
-            return tag
+    return _get_openpype_tag(track)
 
 
 def get_track_openpype_data(track, container_name=None):
@@ -437,7 +422,7 @@ def get_track_openpype_data(track, container_name=None):
         return None
 
     # get tag metadata attribute
-    tag_data = deepcopy(dict(tag.metadata()))
+    tag_data = dict(tag.metadata())
 
     for obj_name, obj_data in tag_data.items():
         obj_name = obj_name.replace("tag.", "")
@@ -481,14 +466,7 @@ def get_trackitem_openpype_tag(track_item):
     Returns:
         hiero.core.Tag: hierarchy, orig clip attributes
     """
-    # get all tags from track item
-    _tags = track_item.tags()
-    if not _tags:
-        return None
-    for tag in _tags:
-        # return only correct tag defined by global name
-        if OPENPYPE_TAG_NAME in tag.name():
-            return tag
+    return _get_openpype_tag(track_item)
 
 
 def set_trackitem_openpype_tag(track_item, data=None):
@@ -548,28 +526,25 @@ def get_trackitem_openpype_data(track_item):
         return None
 
     # get tag metadata attribute
-    tag_data = deepcopy(dict(tag.metadata()))
+    tag_data = dict(tag.metadata())
     # convert tag metadata to normal keys names and values to correct types
     for k, v in tag_data.items():
-        key = k.replace("tag.", "")
+        key = k[4:] if k.startswith("tag.") else k
 
-        try:
-            # capture exceptions which are related to strings only
-            if re.match(r"^[\d]+$", v):
-                value = int(v)
-            elif re.match(r"^True$", v):
-                value = True
-            elif re.match(r"^False$", v):
-                value = False
-            elif re.match(r"^None$", v):
-                value = None
-            elif re.match(r"^[\w\d_]+$", v):
-                value = v
-            else:
+        match = _TAG_VALUE_REGEX.match(v)
+        if match is None:
+            try:
+                # capture exceptions which are related to strings only
                 value = ast.literal_eval(v)
-        except (ValueError, SyntaxError) as msg:
-            log.warning(msg)
+            except (ValueError, SyntaxError) as msg:
+                log.warning(msg)
+                value = v
+        elif match.lastindex == 1:
+            value = int(v)
+        elif match.lastindex == 5:
             value = v
+        else:
+            value = _TAG_VALUE_LITERALS[v]
 
         data[key] = value
 
@@ -610,7 +585,7 @@ def set_publish_attribute(tag, value):
     """
     tag_data = tag.metadata()
     # set data to the publish attribute
-    tag_data.setValue("tag.publish", str(value))
+    tag_data.setValue("tag.publish", _BOOL_TO_STR[bool(value)])
 
 
 def get_publish_attribute(tag):
@@ -623,11 +598,17 @@ def get_publish_attribute(tag):
     tag_data = tag.metadata()
     # get data to the publish attribute
     value = tag_data.value("tag.publish")
-    # return value converted to bool value. Atring is stored in tag.
-    return ast.literal_eval(value)
+    # return value converted to bool value. String is stored in tag.
+    return _STR_TO_BOOL.get(value, False)
+
 
+def sync_avalon_data_to_workfile(project_entity=None):
+    """Sync project attributes and directory to the current workfile.
 
-def sync_avalon_data_to_workfile():
+    Args:
+        project_entity (Optional[dict]): project entity already queried
+            by the caller, queried from server if not provided
+    """
     # import session to get project dir
     project_name = get_current_project_name()
 
@@ -656,7 +637,8 @@ def sync_avalon_data_to_workfile():
         project.setProjectRoot(active_project_root)
 
     # get project data from avalon db
-    project_entity = ayon_api.get_project(project_name)
+    if project_entity is None:
+        project_entity = ayon_api.get_project(project_name)
     project_attribs = project_entity["attrib"]
 
     log.debug("project attributes: {}".format(project_attribs))
@@ -754,6 +736,14 @@ def add_submission():
     registry.addSubmission("Pyblish", PyblishSubmission)
 
 
+# context menus the publish action is added to
+_PUBLISH_ACTION_INTERESTS = (
+    "kShowContextMenu/kTimeline",
+    "kShowContextMenukBin",
+    "kShowContextMenu/kSpreadsheet",
+)
+
+
 class PublishAction(QtWidgets.QAction):
     """
     Action with is showing as menu item
@@ -763,10 +753,9 @@ class PublishAction(QtWidgets.QAction):
         QtWidgets.QAction.__init__(self, "Publish", None)
         self.triggered.connect(self.publish)
 
-        for interest in ["kShowContextMenu/kTimeline",
-                         "kShowContextMenukBin",
-                         "kShowContextMenu/kSpreadsheet"]:
-            hiero.core.events.registerInterest(interest, self.eventHandler)
+        register_interest = hiero.core.events.registerInterest
+        for interest in _PUBLISH_ACTION_INTERESTS:
+            register_interest(interest, self.eventHandler)
 
         self.setShortcut("Ctrl+Alt+P")
 
@@ -862,19 +851,20 @@ def create_nuke_workfile_clips(nuke_workfiles, seq=None):
 
     if not seq:
         seq = hiero.core.Sequence('NewSequences')
-        root.addItem(hiero.core.BinItem(seq))
+        root.addItem(_BinItem(seq))
     # todo will need to define this better
     # track = seq[1]  # lazy example to get a destination#  track
     clips_lst = []
+    tracks_by_name = {track.name(): track for track in seq.videoTracks()}
     for nk in nuke_workfiles:
         task_path = '/'.join([nk['work_dir'], nk['shot'], nk['task']])
         bin = create_bin(task_path, proj)
 
-        if nk['task'] not in seq.videoTracks():
-            track = hiero.core.VideoTrack(nk['task'])
+        track = tracks_by_name.get(nk['task'])
+        if track is None:
+            track = _VideoTrack(nk['task'])
             seq.addTrack(track)
-        else:
-            track = seq.tracks(nk['task'])
+            tracks_by_name[nk['task']] = track
 
         # create clip media
         media = hiero.core.MediaSource(nk['path'])
@@ -899,19 +889,17 @@ def create_nuke_workfile_clips(nuke_workfiles, seq=None):
         name = os.path.basename(os.path.splitext(nk['path'])[0])
         split_name = split_by_client_version(name)[0] or name
 
-        # add to bin as clip item
-        items_in_bin = [b.name() for b in bin.items()]
-        if split_name not in items_in_bin:
-            binItem = hiero.core.BinItem(source)
-            bin.addItem(binItem)
+        # add to bin as clip item and keep reference to it
+        bin_item = next(
+            (b for b in bin.items() if b.name() == split_name), None)
+        if bin_item is None:
+            bin_item = _BinItem(source)
+            bin.addItem(bin_item)
 
-        new_source = [
-            item for item in bin.items() if split_name in item.name()
-        ][0].items()[0].item()
+        new_source = bin_item.items()[0].item()
 
         # add to track as clip item
-        trackItem = hiero.core.TrackItem(
-            split_name, hiero.core.TrackItem.kVideo)
+        trackItem = _TrackItem(split_name, _TrackItem.kVideo)
         trackItem.setSource(new_source)
         trackItem.setSourceIn(source_in)
         trackItem.setSourceOut(source_out)
@@ -937,54 +925,24 @@ def create_bin(path=None, project=None):
 
     path = path.replace("\\", "/").split("/")
 
-    root_bin = project.clipsBin()
+    bin = project.clipsBin()
+    for name in path:
+        # reuse existing bin of the same name or create new one
+        child_bin = next(
+            (b for b in bin.bins() if b.name() == name), None)
+        if child_bin is None:
+            child_bin = _Bin(name)
+            bin.addItem(child_bin)
+        bin = child_bin
 
-    done_bin_lst = []
-    for i, b in enumerate(path):
-        if i == 0 and len(path) > 1:
-            if b in [bin.name() for bin in root_bin.bins()]:
-                bin = [bin for bin in root_bin.bins() if b in bin.name()][0]
-                done_bin_lst.append(bin)
-            else:
-                create_bin = hiero.core.Bin(b)
-                root_bin.addItem(create_bin)
-                done_bin_lst.append(create_bin)
-
-        elif i >= 1 and i < len(path) - 1:
-            if b in [bin.name() for bin in done_bin_lst[i - 1].bins()]:
-                bin = [
-                    bin for bin in done_bin_lst[i - 1].bins()
-                    if b in bin.name()
-                ][0]
-                done_bin_lst.append(bin)
-            else:
-                create_bin = hiero.core.Bin(b)
-                done_bin_lst[i - 1].addItem(create_bin)
-                done_bin_lst.append(create_bin)
-
-        elif i == len(path) - 1:
-            if b in [bin.name() for bin in done_bin_lst[i - 1].bins()]:
-                bin = [
-                    bin for bin in done_bin_lst[i - 1].bins()
-                    if b in bin.name()
-                ][0]
-                done_bin_lst.append(bin)
-            else:
-                create_bin = hiero.core.Bin(b)
-                done_bin_lst[i - 1].addItem(create_bin)
-                done_bin_lst.append(create_bin)
-
-    return done_bin_lst[-1]
+    return bin
 
 
 def split_by_client_version(string):
-    regex = r"[/_.]v\d+"
-    try:
-        matches = re.findall(regex, string, re.IGNORECASE)
-        return string.split(matches[0])
-    except Exception as error:
-        log.error(error)
+    match = _CLIENT_VERSION_REGEX.search(string)
+    if not match:
         return None
+    return string.split(match.group(), 1)
 
 
 def get_selected_track_items(sequence=None):
@@ -1001,7 +959,7 @@ def set_selected_track_items(track_items_list, sequence=None):
     # make sure only trackItems are in list selection
     only_track_items = [
         i for i in track_items_list
-        if isinstance(i, hiero.core.TrackItem)]
+        if isinstance(i, _TrackItem)]
 
     # Getting selection
     timeline_editor = hiero.ui.getTimelineEditor(_sequence)
@@ -1034,11 +992,11 @@ def _set_hrox_project_knobs(doc, **knobs):
     proj_elem = doc.documentElement().firstChildElement("Project")
     for k, v in knobs.items():
         if "ocioconfigpath" in k:
-            paths_to_format = v[platform.system().lower()]
-            for _path in paths_to_format:
-                v = _path.format(**os.environ)
-                if not os.path.exists(v):
-                    continue
+            # first existing path wins, the last one is kept otherwise
+            for _path in v[_PLATFORM_NAME]:
+                v = _path.format_map(os.environ)
+                if os.path.exists(v):
+                    break
         log.debug("Project colorspace knob `{}` was set to `{}`".format(k, v))
         if isinstance(v, dict):
             continue
@@ -1078,13 +1036,16 @@ def apply_colorspace_project():
     }
     widgets = {x: None for x in labels.values()}
 
-    def _recursive_children(widget, labels, widgets):
-        children = widget.children()
-        for count, child in enumerate(children):
-            if isinstance(child, QtWidgets.QLabel):
-                if child.text() in labels.keys():
-                    widgets[labels[child.text()]] = children[count + 1]
-            _recursive_children(child, labels, widgets)
+    def _find_labeled_widgets(widget, labels, widgets):
+        # Qt collects all nested labels in one call, in the same depth
+        # first order as recursing, so the last matching label wins
+        for label in widget.findChildren(QtWidgets.QLabel):
+            text = label.text()
+            if text not in labels:
+                continue
+            # labeled widget is the next sibling of the label
+            siblings = label.parent().children()
+            widgets[labels[text]] = siblings[siblings.index(label) + 1]
 
     app = QtWidgets.QApplication.instance()
     title = "Project Settings"
@@ -1092,7 +1053,7 @@ def apply_colorspace_project():
         if isinstance(widget, QtWidgets.QMainWindow):
             if widget.windowTitle() != title:
                 continue
-            _recursive_children(widget, labels, widgets)
+            _find_labeled_widgets(widget, labels, widgets)
             widget.close()
 
     msg = "Setting value \"{}\" is not a valid option for \"{}\""
@@ -1178,6 +1139,11 @@ def apply_colorspace_clips():
     imageio = get_project_settings(project_name)["hiero"]["imageio"]
 
     presets = imageio.get("regexInputs", {}).get("inputs", {})
+    # compile patterns once, reversed so the last matching preset wins
+    compiled_presets = [
+        (re.compile(preset["regex"]), preset["colorspace"])
+        for preset in reversed(presets)
+    ]
     for clip in clips:
         clip_media_source_path = clip.mediaSource().firstpath()
         clip_name = clip.name()
@@ -1187,11 +1153,14 @@ def apply_colorspace_clips():
             continue
 
         # check if any colorspace presets for read is matching
-        preset_clrsp = None
-        for k in presets:
-            if not bool(re.search(k["regex"], clip_media_source_path)):
-                continue
-            preset_clrsp = k["colorspace"]
+        preset_clrsp = next(
+            (
+                colorspace
+                for regex, colorspace in compiled_presets
+                if regex.search(clip_media_source_path)
+            ),
+            None
+        )
 
         if preset_clrsp:
             log.debug("Changing clip.path: {}".format(clip_media_source_path))
@@ -1205,34 +1174,27 @@ def apply_colorspace_clips():
 
 
 def is_overlapping(ti_test, ti_original, strict=False):
-    covering_exp = (
-        (ti_test.timelineIn() <= ti_original.timelineIn())
-        and (ti_test.timelineOut() >= ti_original.timelineOut())
-    )
+    # read timeline ranges only once from both track items
+    test_in = ti_test.timelineIn()
+    test_out = ti_test.timelineOut()
+    orig_in = ti_original.timelineIn()
+    orig_out = ti_original.timelineOut()
+
+    covering_exp = test_in <= orig_in and test_out >= orig_out
 
     if strict:
         return covering_exp
 
-    inside_exp = (
-        (ti_test.timelineIn() >= ti_original.timelineIn())
-        and (ti_test.timelineOut() <= ti_original.timelineOut())
-    )
-    overlaying_right_exp = (
-        (ti_test.timelineIn() < ti_original.timelineOut())
-        and (ti_test.timelineOut() >= ti_original.timelineOut())
-    )
-    overlaying_left_exp = (
-        (ti_test.timelineOut() > ti_original.timelineIn())
-        and (ti_test.timelineIn() <= ti_original.timelineIn())
+    return (
+        covering_exp
+        # inside
+        or (test_in >= orig_in and test_out <= orig_out)
+        # overlaying right
+        or (test_in < orig_out and test_out >= orig_out)
+        # overlaying left
+        or (test_out > orig_in and test_in <= orig_in)
     )
 
-    return any((
-        covering_exp,
-        inside_exp,
-        overlaying_right_exp,
-        overlaying_left_exp
-    ))
-
 
 def get_sequence_pattern_and_padding(file):
     """ Return sequence pattern and padding from file
@@ -1247,18 +1209,18 @@ def get_sequence_pattern_and_padding(file):
         string: any matching sequence pattern
         int: padding of sequence numbering
     """
-    foundall = re.findall(
-        r"(#+)|(%\d+d)|(?<=[^a-zA-Z0-9])(\d+)(?=\.\w+$)", file)
+    foundall = _SEQUENCE_PATTERN_REGEX.findall(file)
     if not foundall:
         return None, None
     found = sorted(list(set(foundall[0])))[-1]
 
     padding = int(
-        re.findall(r"\d+", found)[-1]) if "%" in found else len(found)
+        _DIGITS_REGEX.findall(found)[-1]) if "%" in found else len(found)
     return found, padding
 
 
 def sync_clip_name_to_data_asset(track_items_list):
+    to_update = []
     # loop through all selected clips
     for track_item in track_items_list:
         # ignore if parent track is locked or disabled
@@ -1282,15 +1244,26 @@ def sync_clip_name_to_data_asset(track_items_list):
         }:
             continue
 
-        # fix data if wrong name
+        # collect data with wrong name
         if data["asset"] != ti_name:
             data["asset"] = ti_name
+            to_update.append((track_item, data))
+
+    if not to_update:
+        return
+
+    # apply all changes without reentering from selection callback
+    _CTX.syncing_clip_names = True
+    try:
+        for track_item, data in to_update:
             # remove the original tag
             tag = get_trackitem_openpype_tag(track_item)
             track_item.removeTag(tag)
             # create new tag with updated data
             set_trackitem_openpype_tag(track_item, data)
-            print("asset was changed in clip: {}".format(ti_name))
+            print("asset was changed in clip: {}".format(track_item.name()))
+    finally:
+        _CTX.syncing_clip_names = False
 
 
 def set_track_color(track_item, color):
@@ -1339,6 +1312,10 @@ def selection_changed_timeline(event):
     Args:
         event (hiero.core.Event): timeline event
     """
+    # ignore selection changes caused by the sync itself
+    if _CTX.syncing_clip_names:
+        return
+
     timeline_editor = event.sender
     selection = timeline_editor.selection()
 
@@ -1361,6 +1338,9 @@ def before_project_save(event):
         check_locked=True,
         check_tagged=True
     )
+    # nothing was created or loaded in the timeline
+    if not any(get_trackitem_openpype_tag(ti) for ti in track_items):
+        return
 
     # run checking function
     sync_clip_name_to_data_asset(track_items)
@@ -91,7 +91,9 @@ def menu_install():
 
     default_tags_action = menu.addAction("Create Default Tags")
     default_tags_action.setIcon(QtGui.QIcon("icons:Position.png"))
-    default_tags_action.triggered.connect(tags.add_tags_to_workfile)
+    default_tags_action.triggered.connect(
+        lambda: tags.add_tags_to_workfile()
+    )
 
     menu.addSeparator()
 
@@ -222,6 +222,7 @@ def create_otio_markers(otio_item, item):
             continue
 
         frame_rate = utils.get_rate(item) or CTX.project_fps
+        tag_metadata = tag.metadata().dict()
 
         marked_range = otio.opentime.TimeRange(
             start_time=otio.opentime.RationalTime(
@@ -229,14 +230,14 @@ def create_otio_markers(otio_item, item):
                 frame_rate
             ),
             duration=otio.opentime.RationalTime(
-                int(tag.metadata().dict().get('tag.length', '0')),
+                int(tag_metadata.get('tag.length', '0')),
                 frame_rate
             )
         )
         # add tag metadata but remove "tag." string
         metadata = {}
 
-        for key, value in tag.metadata().dict().items():
+        for key, value in tag_metadata.items():
             _key = key.replace("tag.", "")
 
             try:
@@ -1,10 +1,8 @@
 """
 Basic avalon integration
 """
-from copy import deepcopy
 import os
 import contextlib
-from collections import OrderedDict
 
 import hiero
 from pyblish import api as pyblish
@@ -34,6 +32,13 @@ CREATE_PATH = os.path.join(PLUGINS_DIR, "create").replace("\\", "/")
 
 AVALON_CONTAINERS = ":AVALON_CONTAINERS"
 
+# hiero classes used in loops, resolved once
+_VideoTrack = hiero.core.VideoTrack
+
+# canonical reprs of container data which already passed the validation
+_VALIDATED_CONTAINERS = set()
+_VALIDATED_CONTAINERS_MAX = 4096
+
 
 def install():
     """Installing Hiero integration."""
@@ -96,18 +101,17 @@ def containerise(track_item,
 
     """
 
-    data_imprint = OrderedDict({
+    data_imprint = {
         "schema": "openpype:container-2.0",
         "id": AVALON_CONTAINER_ID,
         "name": str(name),
         "namespace": str(namespace),
         "loader": str(loader),
         "representation": context["representation"]["id"],
-    })
+    }
 
     if data:
-        for k, v in data.items():
-            data_imprint.update({k: v})
+        data_imprint.update(data)
 
     log.debug("_ data_imprint: {}".format(data_imprint))
     lib.set_trackitem_openpype_tag(track_item, data_imprint)
@@ -131,7 +135,7 @@ def ls():
 
     # append all video tracks
     for track in (lib.get_current_sequence() or []):
-        if type(track) is not hiero.core.VideoTrack:
+        if not isinstance(track, _VideoTrack):
             continue
         all_items.append(track)
 
@@ -167,7 +171,7 @@ def parse_container(item, validate=True):
             return
 
         if validate and data and data.get("schema"):
-            schema.validate(data)
+            _validate_container_data(data)
 
         if not isinstance(data, dict):
             return
@@ -189,7 +193,7 @@ def parse_container(item, validate=True):
         return container
 
     # convert tag metadata to normal keys names
-    if type(item) is hiero.core.VideoTrack:
+    if isinstance(item, _VideoTrack):
         return_list = []
         _data = lib.get_track_openpype_data(item)
 
@@ -205,12 +209,29 @@ def parse_container(item, validate=True):
         return data_to_container(item, _data)
 
 
+def _validate_container_data(data):
+    """Validate container data with schema only if not validated before.
+
+    Args:
+        data (dict): container data from openpype tag
+
+    Raises:
+        schema.ValidationError: if data are not valid
+    """
+    key = repr(sorted(data.items()))
+    if key in _VALIDATED_CONTAINERS:
+        return
+
+    schema.validate(data)
+
+    if len(_VALIDATED_CONTAINERS) >= _VALIDATED_CONTAINERS_MAX:
+        _VALIDATED_CONTAINERS.clear()
+    _VALIDATED_CONTAINERS.add(key)
+
+
 def _update_container_data(container, data):
-    for key in container:
-        try:
-            container[key] = data[key]
-        except KeyError:
-            pass
+    # only keys already present in container are updated
+    container.update({key: data[key] for key in container.keys() & data})
     return container
 
 
@@ -228,19 +249,16 @@ def update_container(item, data=None):
 
     """
 
-    data = data or {}
-    data = deepcopy(data)
+    # container values are flat so shallow copies are enough
+    data = dict(data or {})
 
-    if type(item) is hiero.core.VideoTrack:
+    if isinstance(item, _VideoTrack):
         # form object data for test
         object_name = data["objectName"]
 
-        # get all available containers
+        # get all available containers, parsed freshly from the tag
         containers = lib.get_track_openpype_data(item)
-        container = lib.get_track_openpype_data(item, object_name)
-
-        containers = deepcopy(containers)
-        container = deepcopy(container)
+        container = dict(containers[object_name])
 
         # update data in container
         updated_container = _update_container_data(container, data)
@@ -308,19 +326,16 @@ def reload_config():
     """
     import importlib
 
-    for module in (
-        "ayon_hiero.lib",
-        "ayon_hiero.menu",
-        "ayon_hiero.tags"
+    for module_name in (
+        "ayon_hiero.api.lib",
+        "ayon_hiero.api.menu",
+        "ayon_hiero.api.tags"
     ):
-        log.info("Reloading module: {}...".format(module))
+        log.info("Reloading module: {}...".format(module_name))
         try:
-            module = importlib.import_module(module)
-            import imp
-            imp.reload(module)
+            importlib.reload(importlib.import_module(module_name))
         except Exception as e:
             log.warning("Cannot reload module: {}".format(e))
-            importlib.reload(module)
 
 
 def on_pyblish_instance_toggled(instance, old_value, new_value):
@@ -909,7 +909,7 @@ class PublishClip:
             "families": [self.product_type, self.data["productType"]]
         }
 
-    def _convert_to_entity(self, src_type, template):
+    def _convert_to_entity(self, src_type, template, formatting_data):
         """ Converting input key to key with type. """
         # convert to entity type
         folder_type = self.types.get(src_type, None)
@@ -918,13 +918,6 @@ class PublishClip:
             src_type
         )
 
-        # first collect formatting data to use for formatting template
-        formatting_data = {}
-        for _k, _v in self.hierarchy_data.items():
-            value = _v["value"].format(
-                **self.track_item_default_data)
-            formatting_data[_k] = value
-
         return {
             "folder_type": folder_type,
             "entity_name": template.format(
@@ -941,6 +934,12 @@ class PublishClip:
         par_split = [(pattern.findall(t).pop(), t)
                      for t in self.hierarchy.split("/")]
 
+        # formatting data are the same for all parents so collect them once
+        formatting_data = {
+            _k: _v["value"].format(**self.track_item_default_data)
+            for _k, _v in self.hierarchy_data.items()
+        }
+
         for type, template in par_split:
-            parent = self._convert_to_entity(type, template)
+            parent = self._convert_to_entity(type, template, formatting_data)
             self.parents.append(parent)
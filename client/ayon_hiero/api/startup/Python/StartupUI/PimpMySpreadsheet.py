@@ -4,6 +4,8 @@
 # Requires Hiero 1.7v2 or later.
 # Install Instructions: Copy to ~/.hiero/Python/StartupUI
 
+from contextlib import contextmanager
+
 import hiero.core
 import hiero.ui
 
@@ -66,6 +68,33 @@ gStatusTags = {
     "Final": "icons:status/TagFinal.png"
 }
 
+# Media source metadata keys holding the file type, in order of preference
+gFileTypeKeys = ("foundry.source.type", "media.input.filereader")
+
+# QIcons by file path, so icon files are not loaded again on every repaint
+gIconCache = {}
+
+
+def getCachedIcon(path):
+    """ getCachedIcon(path) -> returns a QIcon for path, created on first use"""
+    icon = gIconCache.get(path)
+    if icon is None:
+        icon = gIconCache[path] = QIcon(path)
+    return icon
+
+
+# Pixmaps by (file path, size) used for painting tag icons in cells
+gPixmapCache = {}
+
+
+def getCachedPixmap(path, size):
+    """ getCachedPixmap(path, size) -> returns a QPixmap fitting a size x size square"""
+    key = (path, size)
+    pixmap = gPixmapCache.get(key)
+    if pixmap is None:
+        pixmap = gPixmapCache[key] = getCachedIcon(path).pixmap(size, size)
+    return pixmap
+
 
 # The Custom Spreadsheet Columns
 class CustomSpreadsheetColumns(QObject):
@@ -146,6 +175,42 @@ class CustomSpreadsheetColumns(QObject):
         },
     ]
 
+    # Column names by index, looked up on every cell call
+    gCustomColumnNames = tuple(c["name"] for c in gCustomColumnList)
+
+    def __init__(self):
+        QObject.__init__(self)
+
+        # Column name to cell callbacks, so cells do not walk an if chain
+        self._dataGetters = {
+            "Tags": self.getTagsString,
+            "Colourspace": self._getColourspace,
+            "Notes": self._getNotesData,
+            "FileType": self._getFileType,
+            "Shot Status": self._getShotStatus,
+            "MediaType": self._getMediaType,
+            "Thumbnail": self._getThumbnail,
+            "Width": self._getWidth,
+            "Height": self._getHeight,
+            "Pixel Aspect": self._getPixelAspect,
+            "Artist": self._getArtistName,
+            "Department": self._getArtistDepartment,
+        }
+        self._tooltipGetters = {
+            "Tags": self._getTagsTooltip,
+            "Notes": self._getNotesTooltip,
+        }
+        self._iconGetters = {
+            "Colourspace": self._getColourspaceIcon,
+            "Shot Status": self._getShotStatusIcon,
+            "MediaType": self._getMediaTypeIcon,
+            "Artist": self._getArtistIcon,
+        }
+        self._cellPainters = {
+            "Tags": self._paintTags,
+            "Thumbnail": self._paintThumbnail,
+        }
+
     def numColumns(self):
         """
       Return the number of custom columns in the spreadsheet view
@@ -156,99 +221,85 @@ class CustomSpreadsheetColumns(QObject):
         """
       Return the name of a custom column
     """
-        return self.gCustomColumnList[column]["name"]
+        return self.gCustomColumnNames[column]
 
     def getTagsString(self, item):
         """
       Convenience method for returning all the Notes in a Tag as a string
     """
-        tagNames = []
-        tags = item.tags()
-        for tag in tags:
-            tagNames += [tag.name()]
-        tagNameString = ','.join(tagNames)
-        return tagNameString
+        return ','.join(tag.name() for tag in item.tags())
 
     def getNotes(self, item):
         """
       Convenience method for returning all the Notes in a Tag as a string
     """
-        notes = ""
-        tags = item.tags()
-        for tag in tags:
-            note = tag.note()
-            if len(note) > 0:
-                notes += tag.note() + ', '
-        return notes[:-2]
+        notes = (tag.note() for tag in item.tags())
+        return ', '.join(note for note in notes if note)
 
     def getData(self, row, column, item):
         """
       Return the data in a cell
     """
-        currentColumn = self.gCustomColumnList[column]
-        if currentColumn["name"] == "Tags":
-            return self.getTagsString(item)
-
-        if currentColumn["name"] == "Colourspace":
-            try:
-                colTransform = item.sourceMediaColourTransform()
-            except:
-                colTransform = "--"
-            return colTransform
-
-        if currentColumn["name"] == "Notes":
-            try:
-                note = self.getNotes(item)
-            except:
-                note = ""
-            return note
-
-        if currentColumn["name"] == "FileType":
-            fileType = "--"
-            M = item.source().mediaSource().metadata()
-            if M.hasKey("foundry.source.type"):
-                fileType = M.value("foundry.source.type")
-            elif M.hasKey("media.input.filereader"):
-                fileType = M.value("media.input.filereader")
-            return fileType
-
-        if currentColumn["name"] == "Shot Status":
-            status = item.status()
-            if not status:
-                status = "--"
-            return str(status)
-
-        if currentColumn["name"] == "MediaType":
-            M = item.mediaType()
-            return str(M).split("MediaType")[-1].replace(".k", "")
-
-        if currentColumn["name"] == "Thumbnail":
-            return str(item.eventNumber())
-
-        if currentColumn["name"] == "Width":
-            return str(item.source().format().width())
-
-        if currentColumn["name"] == "Height":
-            return str(item.source().format().height())
-
-        if currentColumn["name"] == "Pixel Aspect":
-            return str(item.source().format().pixelAspect())
-
-        if currentColumn["name"] == "Artist":
-            if item.artist():
-                name = item.artist()["artistName"]
-                return name
-            else:
-                return "--"
-
-        if currentColumn["name"] == "Department":
-            if item.artist():
-                dep = item.artist()["artistDepartment"]
-                return dep
-            else:
-                return "--"
-
-        return ""
+        getter = self._dataGetters.get(self.gCustomColumnNames[column])
+        if getter is None:
+            return ""
+        return getter(item)
+
+    def _getColourspace(self, item):
+        try:
+            colTransform = item.sourceMediaColourTransform()
+        except:
+            colTransform = "--"
+        return colTransform
+
+    def _getNotesData(self, item):
+        try:
+            note = self.getNotes(item)
+        except:
+            note = ""
+        return note
+
+    def _getFileType(self, item):
+        M = item.source().mediaSource().metadata()
+        for key in gFileTypeKeys:
+            if M.hasKey(key):
+                return M.value(key)
+        return "--"
+
+    def _getShotStatus(self, item):
+        status = item.status()
+        if not status:
+            status = "--"
+        return str(status)
+
+    def _getMediaType(self, item):
+        M = item.mediaType()
+        return str(M).split("MediaType")[-1].replace(".k", "")
+
+    def _getThumbnail(self, item):
+        return str(item.eventNumber())
+
+    def _getWidth(self, item):
+        return str(item.source().format().width())
+
+    def _getHeight(self, item):
+        return str(item.source().format().height())
+
+    def _getPixelAspect(self, item):
+        return str(item.source().format().pixelAspect())
+
+    # artist() walks all the item tags so only call it once per cell
+    def _getArtistName(self, item):
+        artist = item.artist()
+        if artist:
+            return artist["artistName"]
+        return "--"
+
+    def _getArtistDepartment(self, item):
+        artist = item.artist()
+        if artist:
+            return artist["artistDepartment"]
+        return "--"
 
     def setData(self, row, column, item, data):
         """
@@ -261,13 +312,16 @@ class CustomSpreadsheetColumns(QObject):
         """
       Return the tooltip for a cell
     """
-        currentColumn = self.gCustomColumnList[column]
-        if currentColumn["name"] == "Tags":
-            return str([item.name() for item in item.tags()])
+        getter = self._tooltipGetters.get(self.gCustomColumnNames[column])
+        if getter is None:
+            return ""
+        return getter(item)
 
-        if currentColumn["name"] == "Notes":
-            return str(self.getNotes(item))
-        return ""
+    def _getTagsTooltip(self, item):
+        return str([tag.name() for tag in item.tags()])
+
+    def _getNotesTooltip(self, item):
+        return str(self.getNotes(item))
 
     def getFont(self, row, column, item):
         """
@@ -295,34 +349,39 @@ class CustomSpreadsheetColumns(QObject):
         """
       Return the icon for a cell
     """
-        currentColumn = self.gCustomColumnList[column]
-        if currentColumn["name"] == "Colourspace":
-            return QIcon("icons:LUT.png")
-
-        if currentColumn["name"] == "Shot Status":
-            status = item.status()
-            if status:
-                return QIcon(gStatusTags[status])
-
-        if currentColumn["name"] == "MediaType":
-            mediaType = item.mediaType()
-            if mediaType == hiero.core.TrackItem.kVideo:
-                return QIcon("icons:VideoOnly.png")
-            elif mediaType == hiero.core.TrackItem.kAudio:
-                return QIcon("icons:AudioOnly.png")
-
-        if currentColumn["name"] == "Artist":
-            try:
-                return QIcon(item.artist()["artistIcon"])
-            except:
-                return None
+        getter = self._iconGetters.get(self.gCustomColumnNames[column])
+        if getter is None:
+            return None
+        return getter(item)
+
+    def _getColourspaceIcon(self, item):
+        return getCachedIcon("icons:LUT.png")
+
+    def _getShotStatusIcon(self, item):
+        status = item.status()
+        if status:
+            return getCachedIcon(gStatusTags[status])
+        return None
+
+    def _getMediaTypeIcon(self, item):
+        mediaType = item.mediaType()
+        if mediaType == hiero.core.TrackItem.kVideo:
+            return getCachedIcon("icons:VideoOnly.png")
+        elif mediaType == hiero.core.TrackItem.kAudio:
+            return getCachedIcon("icons:AudioOnly.png")
         return None
 
+    def _getArtistIcon(self, item):
+        try:
+            return getCachedIcon(item.artist()["artistIcon"])
+        except:
+            return None
+
     def getSizeHint(self, row, column, item):
         """
       Return the size hint for a cell
     """
-        currentColumnName = self.gCustomColumnList[column]["name"]
+        currentColumnName = self.gCustomColumnNames[column]
 
         if currentColumnName == "Thumbnail":
             return QSize(90, 50)
@@ -334,110 +393,115 @@ class CustomSpreadsheetColumns(QObject):
       Paint a custom cell. Return True if the cell was painted, or False to continue
       with the default cell painting.
     """
-        currentColumn = self.gCustomColumnList[column]
-        if currentColumn["name"] == "Tags":
-            if option.state & QStyle.State_Selected:
-                painter.fillRect(option.rect, option.palette.highlight())
-            iconSize = 20
-            r = QRect(option.rect.x(),
-                      option.rect.y() + (option.rect.height() - iconSize) / 2,
-                      iconSize, iconSize)
-            tags = item.tags()
-            if len(tags) > 0:
-                painter.save()
-                painter.setClipRect(option.rect)
-                for tag in item.tags():
-                    M = tag.metadata()
-                    if not (M.hasKey("tag.status")
-                            or M.hasKey("tag.artistID")):
-                        QIcon(tag.icon()).paint(painter, r, Qt.AlignLeft)
-                        r.translate(r.width() + 2, 0)
-                painter.restore()
-                return True
-
-        if currentColumn["name"] == "Thumbnail":
-            imageView = None
-            pen = QPen()
-            r = QRect(option.rect.x() + 2, (option.rect.y() +
-                                            (option.rect.height() - 46) / 2),
-                      85, 46)
-            if not item.source().mediaSource().isMediaPresent():
-                imageView = QImage("icons:Offline.png")
-                pen.setColor(QColor(Qt.red))
-
-            if item.mediaType() == hiero.core.TrackItem.MediaType.kAudio:
-                imageView = QImage("icons:AudioOnly.png")
-                #pen.setColor(QColor(Qt.green))
-                painter.fillRect(r, QColor(45, 59, 45))
-
-            if option.state & QStyle.State_Selected:
-                painter.fillRect(option.rect, option.palette.highlight())
-
-            tags = item.tags()
+        cellPainter = self._cellPainters.get(self.gCustomColumnNames[column])
+        if cellPainter is None:
+            return False
+        return cellPainter(item, painter, option)
+
+    def _paintTags(self, item, painter, option):
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        iconSize = 20
+        r = QRect(option.rect.x(),
+                  option.rect.y() + (option.rect.height() - iconSize) / 2,
+                  iconSize, iconSize)
+        tags = item.tags()
+        if len(tags) > 0:
             painter.save()
             painter.setClipRect(option.rect)
-
-            if not imageView:
-                try:
-                    imageView = item.thumbnail(item.sourceIn())
-                    pen.setColor(QColor(20, 20, 20))
-                # If we're here, we probably have a TC error, no thumbnail, so get it from the source Clip...
-                except:
-                    pen.setColor(QColor(Qt.red))
-
-            if not imageView:
-                try:
-                    imageView = item.source().thumbnail()
-                    pen.setColor(QColor(Qt.yellow))
-                except:
-                    imageView = QImage("icons:Offline.png")
-                    pen.setColor(QColor(Qt.red))
-
-            QIcon(QPixmap.fromImage(imageView)).paint(painter, r,
-                                                      Qt.AlignCenter)
-            painter.setPen(pen)
-            painter.drawRoundedRect(r, 1, 1)
+            for tag in item.tags():
+                M = tag.metadata()
+                if not (M.hasKey("tag.status")
+                        or M.hasKey("tag.artistID")):
+                    pixmap = getCachedPixmap(tag.icon(), iconSize)
+                    # keep icons smaller than the square centred in the row
+                    target = QStyle.alignedRect(
+                        option.direction, Qt.AlignLeft | Qt.AlignVCenter,
+                        pixmap.size() / pixmap.devicePixelRatio(), r)
+                    painter.drawPixmap(target, pixmap)
+                    r.translate(r.width() + 2, 0)
             painter.restore()
             return True
-
         return False
 
+    def _paintThumbnail(self, item, painter, option):
+        imageView = None
+        pen = QPen()
+        r = QRect(option.rect.x() + 2, (option.rect.y() +
+                                        (option.rect.height() - 46) / 2),
+                  85, 46)
+        if not item.source().mediaSource().isMediaPresent():
+            imageView = QImage("icons:Offline.png")
+            pen.setColor(QColor(Qt.red))
+
+        if item.mediaType() == hiero.core.TrackItem.MediaType.kAudio:
+            imageView = QImage("icons:AudioOnly.png")
+            #pen.setColor(QColor(Qt.green))
+            painter.fillRect(r, QColor(45, 59, 45))
+
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        tags = item.tags()
+        painter.save()
+        painter.setClipRect(option.rect)
+
+        if not imageView:
+            try:
+                imageView = item.thumbnail(item.sourceIn())
+                pen.setColor(QColor(20, 20, 20))
+            # If we're here, we probably have a TC error, no thumbnail, so get it from the source Clip...
+            except:
+                pen.setColor(QColor(Qt.red))
+
+        if not imageView:
+            try:
+                imageView = item.source().thumbnail()
+                pen.setColor(QColor(Qt.yellow))
+            except:
+                imageView = QImage("icons:Offline.png")
+                pen.setColor(QColor(Qt.red))
+
+        QIcon(QPixmap.fromImage(imageView)).paint(painter, r,
+                                                  Qt.AlignCenter)
+        painter.setPen(pen)
+        painter.drawRoundedRect(r, 1, 1)
+        painter.restore()
+        return True
+
     def createEditor(self, row, column, item, view):
         """
       Create an editing widget for a custom cell
     """
         self.currentView = view
 
-        currentColumn = self.gCustomColumnList[column]
-        if currentColumn["cellType"] == "readonly":
+        if self.gCustomColumnList[column]["cellType"] == "readonly":
             cle = QLabel()
             cle.setEnabled(False)
             cle.setVisible(False)
             return cle
 
-        if currentColumn["name"] == "Colourspace":
+        currentColumnName = self.gCustomColumnNames[column]
+        if currentColumnName == "Colourspace":
             cb = QComboBox()
-            for colourspace in self.gColourSpaces:
-                cb.addItem(colourspace)
+            cb.addItems(self.gColourSpaces)
             cb.currentIndexChanged.connect(self.colourspaceChanged)
             return cb
 
-        if currentColumn["name"] == "Shot Status":
+        if currentColumnName == "Shot Status":
             cb = QComboBox()
             cb.addItem("")
             for key in gStatusTags.keys():
-                cb.addItem(QIcon(gStatusTags[key]), key)
+                cb.addItem(getCachedIcon(gStatusTags[key]), key)
             cb.addItem("--")
             cb.currentIndexChanged.connect(self.statusChanged)
 
             return cb
 
-        if currentColumn["name"] == "Artist":
+        if currentColumnName == "Artist":
             cb = QComboBox()
-            cb.addItem("")
-            for artist in gArtistList:
-                cb.addItem(artist["artistName"])
-            cb.addItem("--")
+            artistNames = [artist["artistName"] for artist in gArtistList]
+            cb.addItems([""] + artistNames + ["--"])
             cb.currentIndexChanged.connect(self.artistNameChanged)
             return cb
         return None
@@ -478,7 +542,7 @@ class CustomSpreadsheetColumns(QObject):
         selection = view.selection()
         status = self.sender().currentText()
         project = selection[0].project()
-        with project.beginUndo("Set Status"):
+        with project.beginUndo("Set Status"), batchedEditFinished():
             # A string of "--" characters denotes clear the status
             if status != "--":
                 for trackItem in selection:
@@ -499,7 +563,7 @@ class CustomSpreadsheetColumns(QObject):
         selection = view.selection()
         name = self.sender().currentText()
         project = selection[0].project()
-        with project.beginUndo("Assign Artist"):
+        with project.beginUndo("Assign Artist"), batchedEditFinished():
             # A string of "--" denotes clear the assignee...
             if name != "--":
                 for trackItem in selection:
@@ -513,6 +577,37 @@ class CustomSpreadsheetColumns(QObject):
                             break
 
 
+# Sequences waiting for editFinished() while a batched edit is running
+gBatchedSequences = None
+
+
+@contextmanager
+def batchedEditFinished():
+    """ batchedEditFinished() -> defers Sequence.editFinished() calls to the end of the block, once per sequence"""
+    global gBatchedSequences
+    if gBatchedSequences is not None:
+        # Already batched by an outer block
+        yield
+        return
+
+    gBatchedSequences = []
+    try:
+        yield
+    finally:
+        sequences, gBatchedSequences = gBatchedSequences, None
+        for sequence in sequences:
+            sequence.editFinished()
+
+
+def _editFinished(trackItem):
+    """ _editFinished(trackItem) -> notifies the item sequence about an edit, unless batched"""
+    sequence = trackItem.sequence()
+    if gBatchedSequences is None:
+        sequence.editFinished()
+    elif sequence not in gBatchedSequences:
+        gBatchedSequences.append(sequence)
+
+
 def _getArtistFromID(self, artistID):
     """ getArtistFromID -> returns an artist dictionary, by their given ID"""
     global gArtistList
@@ -539,46 +634,54 @@ def _getArtistFromName(self, artistName):
 
 def _artist(self):
     """_artist -> Returns the artist dictionary assigned to this shot"""
-    artist = None
-    tags = self.tags()
-    for tag in tags:
-        if tag.metadata().hasKey("tag.artistID"):
-            artistID = tag.metadata().value("tag.artistID")
-            artist = self.getArtistFromID(artistID)
-    return artist
+    # The last artist tag wins, so search from the end and stop at the first
+    for tag in reversed(self.tags()):
+        M = tag.metadata()
+        if M.hasKey("tag.artistID"):
+            return self.getArtistFromID(M.value("tag.artistID"))
+    return None
 
 
 def _updateArtistTag(self, artistDict):
     # A shot will only have one artist assigned. Check if one exists and set accordingly
 
     artistTag = None
-    tags = self.tags()
-    for tag in tags:
+    for tag in self.tags():
         if tag.metadata().hasKey("tag.artistID"):
             artistTag = tag
             break
 
+    artistValues = {
+        "tag.artistID": str(artistDict["artistID"]),
+        "tag.artistName": str(artistDict["artistName"]),
+        "tag.artistDepartment": str(artistDict["artistDepartment"]),
+    }
+
     if not artistTag:
         artistTag = hiero.core.Tag("Artist")
         artistTag.setIcon(artistDict["artistIcon"])
-        artistTag.metadata().setValue("tag.artistID",
-                                      str(artistDict["artistID"]))
-        artistTag.metadata().setValue("tag.artistName",
-                                      str(artistDict["artistName"]))
-        artistTag.metadata().setValue("tag.artistDepartment",
-                                      str(artistDict["artistDepartment"]))
-        self.sequence().editFinished()
+        M = artistTag.metadata()
+        for key, value in artistValues.items():
+            M.setValue(key, value)
         self.addTag(artistTag)
-        self.sequence().editFinished()
+        _editFinished(self)
         return
 
-    artistTag.setIcon(artistDict["artistIcon"])
-    artistTag.metadata().setValue("tag.artistID", str(artistDict["artistID"]))
-    artistTag.metadata().setValue("tag.artistName",
-                                  str(artistDict["artistName"]))
-    artistTag.metadata().setValue("tag.artistDepartment",
-                                  str(artistDict["artistDepartment"]))
-    self.sequence().editFinished()
+    # Only write the values which differ, re-assigning an artist is a no-op
+    M = artistTag.metadata()
+    changedValues = {
+        key: value for key, value in artistValues.items()
+        if not M.hasKey(key) or M.value(key) != value
+    }
+    iconChanged = artistTag.icon() != artistDict["artistIcon"]
+    if not changedValues and not iconChanged:
+        return
+
+    if iconChanged:
+        artistTag.setIcon(artistDict["artistIcon"])
+    for key, value in changedValues.items():
+        M.setValue(key, value)
+    _editFinished(self)
     return
 
 
@@ -623,12 +726,12 @@ hiero.core.TrackItem.updateArtistTag = _updateArtistTag
 def _status(self):
     """status -> Returns the Shot status. None if no Status is set."""
 
-    status = None
-    tags = self.tags()
-    for tag in tags:
-        if tag.metadata().hasKey("tag.status"):
-            status = tag.metadata().value("tag.status")
-    return status
+    # The last status tag wins, so search from the end and stop at the first
+    for tag in reversed(self.tags()):
+        M = tag.metadata()
+        if M.hasKey("tag.status"):
+            return M.value("tag.status")
+    return None
 
 
 def _setStatus(self, status):
@@ -647,22 +750,23 @@ def _setStatus(self, status):
 
     # A shot should only have one status. Check if one exists and set accordingly
     statusTag = None
-    tags = self.tags()
-    for tag in tags:
+    for tag in self.tags():
         if tag.metadata().hasKey("tag.status"):
             statusTag = tag
             break
 
-    if not statusTag:
+    newTag = not statusTag
+    if newTag:
         statusTag = hiero.core.Tag("Status")
-        statusTag.setIcon(gStatusTags[status])
-        statusTag.metadata().setValue("tag.status", status)
-        self.addTag(statusTag)
 
     statusTag.setIcon(gStatusTags[status])
-    statusTag.metadata().setValue("tag.status", status)
+    M = statusTag.metadata()
+    M.setValue("tag.status", status)
+
+    if newTag:
+        self.addTag(statusTag)
 
-    self.sequence().editFinished()
+    _editFinished(self)
     return
 
 
@@ -737,7 +841,7 @@ class SetStatusMenu(QMenu):
 
         currentProject = selectedShots[0].project()
 
-        with currentProject.beginUndo("Set Status"):
+        with currentProject.beginUndo("Set Status"), batchedEditFinished():
             # Shots selected
             for shot in selectedShots:
                 shot.setStatus(menuSelectionStatus)
@@ -812,7 +916,7 @@ class AssignArtistMenu(QMenu):
 
         currentProject = selectedShots[0].project()
 
-        with currentProject.beginUndo("Assign Artist"):
+        with currentProject.beginUndo("Assign Artist"), batchedEditFinished():
             # Shots selected
             for shot in selectedShots:
                 shot.setArtistByName(menuSelectionArtist)
@@ -103,9 +103,13 @@ def update_tag(tag, data):
     return tag
 
 
-def add_tags_to_workfile():
+def add_tags_to_workfile(project_entity=None):
     """
     Will create default tags from presets.
+
+    Args:
+        project_entity (Optional[dict]): project entity already queried
+            by the caller, queried from server if not provided
     """
     from .lib import get_current_project
 
@@ -143,7 +147,8 @@ def add_tags_to_workfile():
 
     # Get project task types.
     project_name = get_current_project_name()
-    project_entity = ayon_api.get_project(project_name)
+    if project_entity is None:
+        project_entity = ayon_api.get_project(project_name)
     task_types = project_entity["taskTypes"]
     nks_pres_tags["[Tasks]"] = {}
     log.debug("__ tasks: {}".format(task_types))
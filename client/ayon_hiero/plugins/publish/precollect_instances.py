@@ -342,6 +342,7 @@ class PrecollectInstances(pyblish.api.ContextPlugin):
             dict: otio clip object
 
         """
+        ti_name = track_item.name()
         ti_track_name = track_item.parent().name()
         timeline_range = self.create_otio_time_range_from_timeline_item_data(
             track_item)
@@ -350,7 +351,7 @@ class PrecollectInstances(pyblish.api.ContextPlugin):
             parent_range = otio_clip.range_in_parent()
             if ti_track_name != track_name:
                 continue
-            if otio_clip.name != track_item.name():
+            if otio_clip.name != ti_name:
                 continue
             self.log.debug("__ parent_range: {}".format(parent_range))
             self.log.debug("__ timeline_range: {}".format(timeline_range))